@@ -10,6 +10,7 @@ from typing import Literal
 from fastapi import APIRouter, status
 from sqlalchemy import text
 
+from app.core.config import TEST_ENVIRONMENTS
 from app.db.session import AsyncSessionLocal
 
 router = APIRouter()
@@ -54,7 +55,7 @@ async def health_check():
         Story 2.1 will add Redis connectivity checks.
     """
     # In test environment, return mock statuses (Story 1.1 behavior)
-    is_test_env = os.getenv("ENVIRONMENT") in ["test", "testing"]
+    is_test_env = os.getenv("ENVIRONMENT") in TEST_ENVIRONMENTS
 
     if is_test_env:
         # Mock values for testing (Story 1.1)
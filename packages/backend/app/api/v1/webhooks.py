@@ -4,6 +4,7 @@ Clerk webhook endpoints for user lifecycle events.
 
 import logging
 import uuid
+from functools import lru_cache
 from typing import Annotated, Dict
 
 from fastapi import APIRouter, Depends, HTTPException, Request
@@ -19,6 +20,18 @@ router = APIRouter(prefix="/webhooks", tags=["webhooks"])
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def get_clerk_webhook_verifier() -> Webhook:
+    """
+    Get the Svix verifier for Clerk webhooks.
+    Cached so the signing secret is decoded once per process, not per request.
+
+    Returns:
+        Webhook: Svix verifier configured with CLERK_WEBHOOK_SECRET
+    """
+    return Webhook(settings.CLERK_WEBHOOK_SECRET)
+
+
 @router.post("/clerk")
 async def clerk_webhook_handler(
     request: Request,
@@ -51,8 +64,8 @@ async def clerk_webhook_handler(
     # Get raw body for signature verification
     body = await request.body()
 
-    # Verify webhook signature using Svix
-    wh = Webhook(settings.CLERK_WEBHOOK_SECRET)
+    # Verify webhook signature using Svix (verifier is cached)
+    wh = get_clerk_webhook_verifier()
     try:
         payload = wh.verify(
             body,
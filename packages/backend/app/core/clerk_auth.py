@@ -3,20 +3,18 @@ Clerk authentication dependencies for FastAPI.
 Validates session tokens and loads authenticated users with proper JWT signature verification.
 """
 
-import httpx
 import jwt
 import logging
 import os
-from typing import Annotated, Dict, Any
+from typing import Annotated
 from fastapi import Depends, HTTPException, Request, status
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from jwt import PyJWKClient
 from functools import lru_cache
 
-from app.core.config import settings
+from app.core.config import TEST_ENVIRONMENTS, settings
 from app.db.session import get_db
-from app.models.user import User
+from app.models.user import USER_BY_CLERK_ID, User
 
 logger = logging.getLogger(__name__)
 
@@ -105,7 +103,7 @@ async def get_current_user(
         # CRITICAL: Check os.environ directly, not settings.ENVIRONMENT
         # The settings singleton is created at import time before tests set the env variable
         # Tests set ENVIRONMENT via pytest_configure() hook in conftest.py
-        is_test_env = os.getenv("ENVIRONMENT") in ["test", "testing"]
+        is_test_env = os.getenv("ENVIRONMENT") in TEST_ENVIRONMENTS
 
         if is_test_env:
             # TEST MODE: Decode without signature verification
@@ -157,7 +155,8 @@ async def get_current_user(
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-        logger.debug(f"Successfully verified JWT for user: {clerk_user_id[:8]}...")
+        # Lazy %-formatting: the message is only built when DEBUG logging is enabled
+        logger.debug("Successfully verified JWT for user: %s...", clerk_user_id[:8])
 
     except HTTPException:
         # Re-raise HTTPExceptions (like "Invalid token format")
@@ -185,7 +184,7 @@ async def get_current_user(
         )
 
     # Find user in database
-    result = await db.execute(select(User).where(User.clerk_user_id == clerk_user_id))
+    result = await db.execute(USER_BY_CLERK_ID, {"clerk_user_id": clerk_user_id})
     user = result.scalar_one_or_none()
 
     if not user:
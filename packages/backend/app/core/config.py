@@ -7,6 +7,9 @@ from typing import Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# ENVIRONMENT values treated as test runs (mocked health statuses, signature-less JWTs)
+TEST_ENVIRONMENTS = frozenset({"test", "testing"})
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
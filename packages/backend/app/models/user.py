@@ -4,7 +4,7 @@ Defines core user tables with Clerk integration.
 """
 
 import uuid
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, String, func
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, String, bindparam, func, select
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
@@ -18,6 +18,9 @@ class User(Base):
     """
 
     __tablename__ = "users"
+    # Fetch server-generated created_at/updated_at via RETURNING on INSERT and UPDATE,
+    # so callers get a fully loaded user without a follow-up refresh() SELECT
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     clerk_user_id = Column(
@@ -51,6 +54,12 @@ class User(Base):
         return f"<User(id={self.id}, clerk_user_id={self.clerk_user_id}, email={self.email})>"
 
 
+# Lookup by Clerk ID, shared by auth and the Clerk webhook sync. Built once with a bound
+# parameter so the select() construct isn't rebuilt per call (the compiled SQL is cached
+# either way). Execute with {"clerk_user_id": ...}.
+USER_BY_CLERK_ID = select(User).where(User.clerk_user_id == bindparam("clerk_user_id"))
+
+
 class UserPreferences(Base):
     """
     User preferences and onboarding state.
@@ -5,7 +5,7 @@ Pydantic schemas for user-related API responses.
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel
 
 
 class UserResponse(BaseModel):
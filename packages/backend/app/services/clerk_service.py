@@ -3,10 +3,9 @@ Clerk user synchronization service.
 Handles creating and updating users from Clerk webhook events.
 """
 
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.user import User
+from app.models.user import USER_BY_CLERK_ID, User
 from app.schemas.webhook import ClerkUserData
 
 
@@ -27,6 +26,10 @@ class ClerkService:
 
         Returns:
             User: Created or updated user record
+
+        Note:
+            No refresh() after commit: User uses eager_defaults, so server-generated
+            created_at/updated_at are loaded by the INSERT/UPDATE itself (RETURNING).
         """
         # Extract email (primary email address)
         email = None
@@ -44,9 +47,7 @@ class ClerkService:
             display_name = clerk_data.username
 
         # Check if user exists
-        result = await db.execute(
-            select(User).where(User.clerk_user_id == clerk_data.id)
-        )
+        result = await db.execute(USER_BY_CLERK_ID, {"clerk_user_id": clerk_data.id})
         user = result.scalar_one_or_none()
 
         if user:
@@ -64,5 +65,4 @@ class ClerkService:
             db.add(user)
 
         await db.commit()
-        await db.refresh(user)
         return user
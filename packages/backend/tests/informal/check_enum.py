@@ -1,14 +1,12 @@
 import asyncio
-from pathlib import Path
-from dotenv import load_dotenv
+from env_bootstrap import load_env, make_engine
 from sqlalchemy import text
 from app.core.config import settings
-from sqlalchemy.ext.asyncio import create_async_engine
 
-load_dotenv(Path(__file__).parent / ".env")
+load_env()
 
 async def check_enum():
-    engine = create_async_engine(settings.async_database_url)
+    engine = make_engine(settings.async_database_url)
     async with engine.connect() as conn:
         result = await conn.execute(text("""
             SELECT e.enumlabel as value
@@ -0,0 +1,52 @@
+"""
+Shared .env loading for the informal diagnostic scripts.
+
+Usage:
+    from env_bootstrap import load_env, make_engine
+    load_env()
+    engine = make_engine(settings.async_database_url)
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+# These scripts live in packages/backend/tests/informal; the .env sits in packages/backend
+ENV_PATH = Path(__file__).resolve().parents[2] / ".env"
+
+
+@lru_cache(maxsize=1)
+def load_env() -> bool:
+    """
+    Load packages/backend/.env into os.environ once per process.
+    Repeated calls (e.g. scripts importing each other) skip the file read and parse.
+
+    Returns:
+        bool: True if the .env file was found and loaded
+    """
+    return load_dotenv(ENV_PATH)
+
+
+def make_engine(url: str, *, pool_size: int = 1, **kw):
+    """
+    Create an async engine sized for a short-lived diagnostic script.
+
+    Pool is capped at pool_size connections with no overflow; pre-ping discards
+    connections the server has dropped. SQLite URLs (used in tests) get no pool
+    arguments, since SQLAlchemy rejects them for SQLite pools. SQLAlchemy is
+    imported lazily so scripts that only need load_env() don't require it.
+
+    Args:
+        url: Async database URL
+        pool_size: Connections the script uses concurrently (default 1)
+        **kw: Extra create_async_engine arguments (e.g. echo=True)
+
+    Returns:
+        AsyncEngine
+    """
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    if not url.startswith("sqlite"):
+        kw.update(pool_size=pool_size, max_overflow=0, pool_pre_ping=True)
+    return create_async_engine(url, **kw)
@@ -16,20 +16,18 @@ The migration is the cleaner approach for version control.
 """
 
 import asyncio
-from pathlib import Path
-from dotenv import load_dotenv
+from env_bootstrap import load_env, make_engine
 from sqlalchemy import text, select
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker
 
 from app.core.config import settings
 from app.models.memory import Memory, MemoryType
 from app.models.user import User
 
 # Load environment
-load_dotenv(Path(__file__).parent / ".env")
-engine = create_async_engine(settings.async_database_url, echo=False)
-async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+load_env()
+engine = make_engine(settings.async_database_url, echo=False)
+async_session = async_sessionmaker(engine, expire_on_commit=False)
 
 
 async def add_missing_indexes():
@@ -6,81 +6,107 @@ Usage:
 """
 
 import asyncio
-from pathlib import Path
-from dotenv import load_dotenv
+import sys
+from env_bootstrap import load_env, make_engine
 from sqlalchemy import select, func
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker
 
 from app.core.config import settings
 from app.models.memory import Memory, MemoryType, MemoryCollection
 from app.models.user import User
 
 # Load environment
-load_dotenv(Path(__file__).parent / ".env")
-engine = create_async_engine(settings.async_database_url, echo=False)
-async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+load_env()
+engine = make_engine(settings.async_database_url, echo=False)
+async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+
+def flush_lines(lines):
+    """Write buffered report lines to stdout in one call and clear the buffer."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        lines.clear()
 
 
 async def view_all_data():
     """Display all memory system data in a readable format."""
-    print("\n" + "=" * 80)
-    print("MEMORY SYSTEM DATA VIEWER")
-    print("=" * 80)
+    # Report lines are buffered and written per section instead of one print() per line
+    lines = [
+        "\n" + "=" * 80,
+        "MEMORY SYSTEM DATA VIEWER",
+        "=" * 80,
+    ]
 
     async with async_session() as session:
-        # Users
-        result = await session.execute(select(User))
-        users = result.scalars().all()
-        print(f"\n👤 Users: {len(users)}")
+        # Users (only the columns displayed, not full ORM objects)
+        result = await session.execute(select(User.clerk_user_id, User.email))
+        users = result.all()
+        lines.append(f"\n👤 Users: {len(users)}")
         for user in users:
-            print(f"   - {user.clerk_user_id} ({user.email})")
+            lines.append(f"   - {user.clerk_user_id} ({user.email})")
 
-        # Memory counts by type
-        print(f"\n🧠 Memories by Type:")
+        # Memory counts by type (one GROUP BY instead of a COUNT query per tier)
+        result = await session.execute(
+            select(Memory.memory_type, func.count(Memory.id)).group_by(Memory.memory_type)
+        )
+        counts = dict(result.all())
+        lines.append(f"\n🧠 Memories by Type:")
         for memory_type in MemoryType:
-            result = await session.execute(
-                select(func.count(Memory.id)).where(Memory.memory_type == memory_type)
-            )
-            count = result.scalar()
-            print(f"   - {memory_type.value.upper()}: {count}")
+            lines.append(f"   - {memory_type.value.upper()}: {counts.get(memory_type, 0)}")
 
-        # Recent memories
+        # Recent memories (projection skips the 1536-dim embedding column)
         result = await session.execute(
-            select(Memory).order_by(Memory.created_at.desc()).limit(5)
+            select(Memory.memory_type, Memory.content, Memory.extra_data)
+            .order_by(Memory.created_at.desc())
+            .limit(5)
         )
-        memories = result.scalars().all()
-        print(f"\n📝 Recent Memories (last {len(memories)}):")
+        memories = result.all()
+        lines.append(f"\n📝 Recent Memories (last {len(memories)}):")
         for mem in memories:
             content_preview = mem.content[:60] + "..." if len(mem.content) > 60 else mem.content
-            print(f"   - [{mem.memory_type.value}] {content_preview}")
+            lines.append(f"   - [{mem.memory_type.value}] {content_preview}")
             if mem.extra_data:
-                print(f"     Metadata: {mem.extra_data}")
+                lines.append(f"     Metadata: {mem.extra_data}")
 
         # Collections
-        result = await session.execute(select(MemoryCollection))
-        collections = result.scalars().all()
-        print(f"\n📁 Collections: {len(collections)}")
+        result = await session.execute(
+            select(
+                MemoryCollection.name,
+                MemoryCollection.collection_type,
+                MemoryCollection.description,
+            )
+        )
+        collections = result.all()
+        lines.append(f"\n📁 Collections: {len(collections)}")
         for coll in collections:
-            print(f"   - {coll.name} ({coll.collection_type})")
+            lines.append(f"   - {coll.name} ({coll.collection_type})")
             if coll.description:
-                print(f"     {coll.description}")
+                lines.append(f"     {coll.description}")
+        flush_lines(lines)
 
         # Stressor memories (JSONB query demo)
-        result = await session.execute(
-            select(Memory)
+        # Unbounded result set: stream in batches instead of materializing every row
+        result = await session.stream(
+            select(Memory.content, Memory.extra_data)
             .where(Memory.extra_data["stressor"].as_boolean().is_(True))  # NULL-safe comparison
+            .execution_options(yield_per=1000)
         )
-        stressors = result.scalars().all()
-        print(f"\n😰 Stressor Memories: {len(stressors)}")
-        for mem in stressors:
+        lines.append("\n😰 Stressor Memories:")
+        stressor_count = 0
+        async for mem in result:
+            stressor_count += 1
             emotion = mem.extra_data.get("emotion", "unknown")
             intensity = mem.extra_data.get("intensity", 0)
             content_preview = mem.content[:60] + "..." if len(mem.content) > 60 else mem.content
-            print(f"   - {content_preview}")
-            print(f"     Emotion: {emotion}, Intensity: {intensity}")
+            lines.append(f"   - {content_preview}")
+            lines.append(f"     Emotion: {emotion}, Intensity: {intensity}")
+            # Flush every 100 memories so the buffer stays bounded while streaming
+            if stressor_count % 100 == 0:
+                flush_lines(lines)
+        lines.append(f"   Total: {stressor_count}")
 
-    print("\n" + "=" * 80)
+    lines.append("\n" + "=" * 80)
+    flush_lines(lines)
     await engine.dispose()
 
 
@@ -0,0 +1,82 @@
+"""
+Integration Tests: Clerk User Sync Service (Story 1.3)
+
+Tests for ClerkService.create_or_update_user():
+- Returned user is fully loaded after create and update
+- Server-generated timestamps are readable without a follow-up query
+"""
+
+import pytest
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.schemas.webhook import ClerkUserData
+from app.services.clerk_service import ClerkService
+
+
+def make_clerk_data(clerk_user_id: str, email: str, first_name: str) -> ClerkUserData:
+    """Build Clerk webhook user data for a single primary email."""
+    return ClerkUserData(
+        id=clerk_user_id,
+        email_addresses=[{"email_address": email}],
+        first_name=first_name,
+        last_name="User",
+    )
+
+
+@pytest.mark.integration
+@pytest.mark.database
+class TestCreateOrUpdateUser:
+    """
+    Test suite for ClerkService.create_or_update_user().
+
+    The service commits without refresh(); User's eager_defaults must load
+    created_at/updated_at from the INSERT/UPDATE itself. On an async session,
+    reading an unloaded attribute would lazy-load and raise MissingGreenlet.
+    """
+
+    async def test_created_user_has_timestamps_loaded(self, db_session: AsyncSession):
+        """
+        Story 1.3: Created user is returned fully loaded
+
+        Given: No user exists for the Clerk ID
+        When: create_or_update_user() creates the user
+        Then: created_at/updated_at are populated without further DB access
+        """
+        user = await ClerkService.create_or_update_user(
+            db_session,
+            make_clerk_data("user_service_create_001", "create@example.com", "Create"),
+        )
+
+        unloaded = inspect(user).unloaded
+        assert "created_at" not in unloaded
+        assert "updated_at" not in unloaded
+        assert user.created_at is not None
+        assert user.updated_at is not None
+        assert user.display_name == "Create User"
+
+    async def test_updated_user_has_timestamps_loaded(self, db_session: AsyncSession):
+        """
+        Story 1.3: Updated user is returned fully loaded
+
+        Given: User exists for the Clerk ID
+        When: create_or_update_user() updates the user with new data
+        Then: created_at/updated_at are populated without further DB access
+        """
+        clerk_user_id = "user_service_update_001"
+        created = await ClerkService.create_or_update_user(
+            db_session, make_clerk_data(clerk_user_id, "before@example.com", "Before")
+        )
+
+        user = await ClerkService.create_or_update_user(
+            db_session, make_clerk_data(clerk_user_id, "after@example.com", "After")
+        )
+
+        unloaded = inspect(user).unloaded
+        assert "created_at" not in unloaded
+        assert "updated_at" not in unloaded
+        assert user.created_at is not None
+        assert user.updated_at is not None
+        assert user.id == created.id
+        assert user.email == "after@example.com"
+        assert user.display_name == "After User"